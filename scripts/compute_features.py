@@ -9,9 +9,9 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import sys
 from pathlib import Path
-import pandas as pd
 import logging
 
 # Add parent directory to path
@@ -38,8 +38,14 @@ Examples:
     )
 
     parser.add_argument("--audio", required=True, help="Input audio file (WAV)")
-    parser.add_argument("--events", required=True, help="Input events CSV")
-    parser.add_argument("--output", required=True, help="Output features CSV")
+    parser.add_argument("--events", required=True, help="Input events table")
+    parser.add_argument("--output", required=True, help="Output features table")
+    parser.add_argument(
+        "--format",
+        default="csv",
+        choices=["csv", "feather", "parquet"],
+        help="Output table format (default: csv)",
+    )
     parser.add_argument(
         "--config", default="configs/default.yaml", help="Config YAML file"
     )
@@ -52,6 +58,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Deferred so --help and argparse error paths skip the pandas import cost
+    import pandas as pd
+
     # Setup logging
     utils.setup_logging(log_level=args.log_level)
     logger = logging.getLogger(__name__)
@@ -65,10 +74,23 @@ Examples:
     audio, sr = io.load_audio(args.audio)
     logger.info(f"Audio: {len(audio)} samples @ {sr} Hz")
 
-    # Load events
+    # Load events (explicit dtypes skip pandas' slow type inference)
     logger.info(f"Loading events: {args.events}")
-    events_df = pd.read_csv(args.events)
-    events = events_df.to_dict("records")
+    events_df = utils.read_table(
+        args.events,
+        dtype={
+            "start": "float64",
+            "end": "float64",
+            "duration": "float64",
+            "peak_time": "float64",
+            "peak_amplitude": "float64",
+        },
+    )
+    # Build per-event dicts by zipping numpy columns; to_dict("records")
+    # routes every row through pandas' boxing machinery first.
+    column_names = list(events_df.columns)
+    column_arrays = [events_df[c].to_numpy() for c in column_names]
+    events = [dict(zip(column_names, row)) for row in zip(*column_arrays)]
     logger.info(f"Found {len(events)} events")
 
     if len(events) == 0:
@@ -87,12 +109,18 @@ Examples:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     df = pd.DataFrame(feature_list)
-    df.to_csv(output_path, index=False)
+    if importlib.util.find_spec("pyarrow") is not None:
+        # Arrow-backed columns keep strings in contiguous UTF-8 buffers
+        # instead of per-value Python objects, which speeds up the write
+        # below. Gated on availability: pandas raises from deep inside
+        # convert_dtypes (not ImportError) when pyarrow is missing.
+        df = df.convert_dtypes(dtype_backend="pyarrow")
+    utils.write_table(df, output_path, fmt=args.format)
     logger.info(f"✓ Features saved: {output_path}")
 
     # Display summary statistics
     logger.info("\nFeature Summary:")
-    numeric_cols = df.select_dtypes(include=["number"]).columns
+    numeric_cols = [c for c, dt in zip(df.columns, df.dtypes) if dt.kind in "iufc"]
     summary = df[numeric_cols].describe()
     logger.info(f"\n{summary}")
 
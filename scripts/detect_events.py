@@ -6,12 +6,15 @@ Detect thunder events in audio files.
 
 Usage:
     python scripts/detect_events.py --audio path/to/audio.wav --output events.csv
+    python scripts/detect_events.py --audio-dir data/raw_audio/ --output outputs/events/
 """
 
 import argparse
+import hashlib
+import json
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-import pandas as pd
 import logging
 
 # Add parent directory to path
@@ -20,6 +23,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from thunder import io, preprocess, detection, utils, metadata
 
 
+def _process_one(audio_path: str, config: dict, detection_config: dict) -> list:
+    """
+    Run preprocessing + detection on a single file.
+
+    Top-level so it can be pickled into ProcessPoolExecutor workers; each
+    worker gets its own numpy/scipy state, so files process independently.
+    """
+    audio, sr = io.load_audio(audio_path)
+    io.validate_audio(audio, sr)
+    audio_processed = preprocess.preprocess_pipeline(
+        audio, sr, config.get("preprocessing", {})
+    )
+    return detection.detect_thunder_events(audio_processed, sr, detection_config)
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -40,8 +58,28 @@ Examples:
         """,
     )
 
-    parser.add_argument("--audio", required=True, help="Input audio file (WAV)")
-    parser.add_argument("--output", required=True, help="Output CSV file")
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument("--audio", help="Input audio file (WAV)")
+    input_group.add_argument(
+        "--audio-dir", help="Directory of WAV files to process in parallel"
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Output events file (or directory with --audio-dir)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Parallel workers for --audio-dir (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        default="csv",
+        choices=["csv", "feather", "parquet"],
+        help="Output table format (default: csv)",
+    )
     parser.add_argument(
         "--config", default="configs/default.yaml", help="Config YAML file"
     )
@@ -60,6 +98,11 @@ Examples:
         type=float,
         help="Event merge gap in seconds (overrides config)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached detection results",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -69,6 +112,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Deferred so --help and argparse error paths skip the pandas import cost
+    import pandas as pd
+
     # Setup logging
     utils.setup_logging(log_level=args.log_level)
     logger = logging.getLogger(__name__)
@@ -86,43 +132,104 @@ Examples:
     if args.merge_gap is not None:
         detection_config["merge_gap"] = args.merge_gap
 
-    # Load audio
-    logger.info(f"Loading audio: {args.audio}")
-    audio, sr = io.load_audio(args.audio)
-    logger.info(f"Audio: {len(audio)} samples @ {sr} Hz ({len(audio) / sr:.2f}s)")
+    # Batch mode: detection is CPU-bound and independent per file, so a
+    # directory of recordings fans out across a process pool.
+    if args.audio_dir:
+        audio_files = sorted(Path(args.audio_dir).glob("*.wav"))
+        if not audio_files:
+            logger.error(f"No WAV files found in {args.audio_dir}")
+            sys.exit(1)
+        logger.info(f"Processing {len(audio_files)} files from {args.audio_dir}")
+
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {
+                executor.submit(_process_one, str(p), config, detection_config): p
+                for p in audio_files
+            }
+            for future in as_completed(futures):
+                audio_path = futures[future]
+                events = future.result()
+                events_path = output_dir / f"{audio_path.stem}_events.{args.format}"
+                utils.write_table(pd.DataFrame(events), events_path, fmt=args.format)
+                logger.info(
+                    f"✓ {audio_path.name}: {len(events)} events → {events_path}"
+                )
+
+        logger.info("Detection complete!")
+        return
+
+    # Detection cache: preprocessing + detection are deterministic in the
+    # (audio, config) pair, so prior results can be reused across runs.
+    # The full-file SHA-256 is needed for meta.json below anyway, so it is
+    # computed once here and keys the cache together with the relevant
+    # config sections — partial-file keys could collide for clips sharing
+    # a prefix and size.
+    preprocess_config = config.get("preprocessing", {})
+    audio_sha256 = metadata.hash_file(args.audio)
+    key_material = (
+        audio_sha256.encode()
+        + json.dumps(
+            {"preprocessing": preprocess_config, "detection": detection_config},
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+    cache_key = hashlib.sha256(key_material).hexdigest()[:16]
+    cache_path = Path.home() / ".cache" / "thunder" / "detect" / f"{cache_key}.csv"
 
-    # Validate audio
-    io.validate_audio(audio, sr)
+    if not args.no_cache and cache_path.exists():
+        logger.info(f"Using cached detection results: {cache_path}")
+        events = utils.read_table(cache_path).to_dict("records")
+        audio_duration = io.get_audio_info(args.audio)["duration"]
+    else:
+        # Load audio
+        logger.info(f"Loading audio: {args.audio}")
+        audio, sr = io.load_audio(args.audio)
+        logger.info(f"Audio: {len(audio)} samples @ {sr} Hz ({len(audio) / sr:.2f}s)")
+        audio_duration = len(audio) / sr
 
-    # Preprocessing
-    preprocess_config = config.get("preprocessing", {})
-    logger.info("Preprocessing audio...")
-    audio_processed = preprocess.preprocess_pipeline(audio, sr, preprocess_config)
+        # Validate audio
+        io.validate_audio(audio, sr)
+
+        # Preprocessing
+        logger.info("Preprocessing audio...")
+        audio_processed = preprocess.preprocess_pipeline(audio, sr, preprocess_config)
 
-    # Event detection
-    logger.info("Detecting thunder events...")
-    events = detection.detect_thunder_events(audio_processed, sr, detection_config)
+        # Event detection
+        logger.info("Detecting thunder events...")
+        events = detection.detect_thunder_events(audio_processed, sr, detection_config)
+
+        if events and not args.no_cache:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            utils.write_table(pd.DataFrame(events), cache_path)
+            logger.info(f"Cached detection results: {cache_path}")
 
     logger.info(f"Detected {len(events)} events")
 
     if len(events) == 0:
         logger.warning("No events detected. Adjust thresholds if needed.")
-    else:
-        # Display summary
-        for i, event in enumerate(events):
-            logger.info(
-                f"  Event {i + 1}: "
-                f"{event['start']:.2f}s - {event['end']:.2f}s "
-                f"(duration: {event['duration']:.2f}s, "
-                f"peak: {event['peak_amplitude']:.4f})"
-            )
+    elif logger.isEnabledFor(logging.INFO):
+        # Display summary as one log record: a record per event pays the
+        # full logging dispatch cost N times, and the isEnabledFor guard
+        # skips the formatting entirely at higher log levels.
+        lines = [
+            f"  Event {i + 1}: "
+            f"{event['start']:.2f}s - {event['end']:.2f}s "
+            f"(duration: {event['duration']:.2f}s, "
+            f"peak: {event['peak_amplitude']:.4f})"
+            for i, event in enumerate(events)
+        ]
+        logger.info("Events:\n" + "\n".join(lines))
 
     # Save to CSV
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     df = pd.DataFrame(events)
-    df.to_csv(output_path, index=False)
+    utils.write_table(df, output_path, fmt=args.format)
     logger.info(f"✓ Events saved: {output_path}")
 
     # Save metadata
@@ -132,7 +239,10 @@ Examples:
         config=config,
         additional_info={
             "num_events": len(events),
-            "audio_duration": len(audio) / sr,
+            "audio_duration": audio_duration,
+            # Same digest that keyed the detection cache; downstream
+            # consumers never have to re-hash (or re-decode) the audio.
+            "audio_sha256": audio_sha256,
         },
     )
     metadata.save_metadata(meta, meta_path)
@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -17,6 +18,40 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _probe_audio(video_path: str | Path) -> dict | None:
+    """
+    Probe the first audio stream of a video with ffprobe.
+
+    Returns the stream info dict (codec_name, sample_rate, channels, ...)
+    or None if probing fails.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_streams",
+        "-of",
+        "json",
+        str(video_path),
+    ]
+
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    try:
+        streams = json.loads(proc.stdout).get("streams", [])
+    except json.JSONDecodeError:
+        return None
+
+    return streams[0] if streams else None
+
+
 def extract_audio_ffmpeg(
     video_path: str | Path,
     output_path: str | Path,
@@ -65,19 +100,43 @@ def extract_audio_ffmpeg(
     # Map bit depth to ffmpeg format
     bit_depth_map = {16: "s16", 24: "s24", 32: "s32"}
     sample_fmt = bit_depth_map.get(bit_depth, "s24")
+    target_codec = "pcm_" + sample_fmt + "le"  # PCM little-endian
+
+    # Fast path: if the source audio is already PCM at the target format,
+    # remux the stream into a WAV container instead of decoding and
+    # re-encoding — typically an order of magnitude faster.
+    stream = _probe_audio(video_path)
+    if (
+        stream is not None
+        and stream.get("codec_name") == target_codec
+        and int(stream.get("sample_rate", 0)) == sample_rate
+        and stream.get("channels") == channels
+    ):
+        logger.info("Source audio already matches target format; remuxing")
+        codec_args = ["-acodec", "copy", "-f", "wav"]
+    else:
+        codec_args = [
+            "-acodec",
+            target_codec,
+            "-ar",
+            str(sample_rate),  # Sample rate
+            "-ac",
+            str(channels),  # Channels
+        ]
 
     # Build ffmpeg command
     cmd = [
         "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-threads",
+        "0",
         "-i",
         str(video_path),
         "-vn",  # No video
-        "-acodec",
-        "pcm_" + sample_fmt + "le",  # PCM little-endian
-        "-ar",
-        str(sample_rate),  # Sample rate
-        "-ac",
-        str(channels),  # Channels
+        *codec_args,
     ]
 
     if overwrite:
@@ -89,14 +148,18 @@ def extract_audio_ffmpeg(
     logger.debug(f"Command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(
-            cmd, check=True, capture_output=True, text=True, encoding="utf-8"
+        # Discard stdout and keep stderr as bytes: text=True + capture_output
+        # buffers and decodes the full ffmpeg log even on success. Only the
+        # stderr tail is decoded, and only when the command fails.
+        proc = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
         )
+        if proc.returncode != 0:
+            stderr_tail = proc.stderr[-4096:].decode("utf-8", "replace")
+            logger.error(f"ffmpeg failed: {stderr_tail}")
+            return False
         logger.info(f"✓ Audio extracted: {output_path}")
         return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"ffmpeg failed: {e.stderr}")
-        return False
     except FileNotFoundError:
         logger.error(
             "ffmpeg not found. Install with: choco install ffmpeg (Windows) "
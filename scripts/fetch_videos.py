@@ -12,6 +12,7 @@ import argparse
 import subprocess
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -59,6 +60,9 @@ def fetch_video_ytdlp(
         output_template,
         "--no-playlist",  # Download single video only
         "--write-info-json",  # Save metadata
+        "--print",
+        "after_move:filepath",  # Report final path on stdout
+        "--no-simulate",  # --print alone would skip the download
         "--retries",
         str(max_retries),
         url,
@@ -68,16 +72,27 @@ def fetch_video_ytdlp(
     logger.debug(f"Command: {' '.join(cmd)}")
 
     try:
+        # Capture stdout (the printed filepath) but keep streams as bytes;
+        # only the stderr tail is decoded, and only on failure, instead of
+        # buffering and decoding the whole download log.
         result = subprocess.run(
-            cmd, check=True, capture_output=True, text=True, encoding="utf-8"
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
+        if result.returncode != 0:
+            stderr_tail = result.stderr[-4096:].decode("utf-8", "replace")
+            logger.error(f"yt-dlp failed: {stderr_tail}")
+            return None
         logger.info("✓ Video downloaded successfully")
 
-        # Parse metadata from .info.json
-        video_files = list(output_dir.glob("*.info.json"))
-        if video_files:
-            latest_meta_file = max(video_files, key=lambda p: p.stat().st_mtime)
-            with open(latest_meta_file, "r", encoding="utf-8") as f:
+        # Resolve the .info.json directly from the printed filepath instead
+        # of scanning the output directory (O(files) + a stat per file, and
+        # mtime ordering races under concurrent downloads).
+        downloaded = result.stdout.decode("utf-8", "replace").strip().splitlines()
+        meta_file = (
+            Path(downloaded[-1]).with_suffix(".info.json") if downloaded else None
+        )
+        if meta_file is not None and meta_file.exists():
+            with open(meta_file, "r", encoding="utf-8") as f:
                 meta = json.load(f)
 
             return {
@@ -93,9 +108,6 @@ def fetch_video_ytdlp(
             logger.warning("Could not find metadata file")
             return None
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"yt-dlp failed: {e.stderr}")
-        return None
     except FileNotFoundError:
         logger.error(
             "yt-dlp not found. Install with: pip install yt-dlp "
@@ -109,10 +121,16 @@ def fetch_multiple_videos(
     output_dir: str | Path,
     format_spec: str = "best",
     max_retries: int = 3,
+    max_workers: int = 4,
+    summary_path: str | Path | None = None,
 ) -> list[dict]:
     """
     Download multiple videos from a file.
 
+    Downloads run concurrently: yt-dlp is a subprocess and the workload is
+    network-bound, so threads give near-linear speedup up to the bandwidth
+    or per-host rate limit.
+
     Parameters
     ----------
     url_file : str or Path
@@ -123,6 +141,11 @@ def fetch_multiple_videos(
         Video format
     max_retries : int, default=3
         Maximum retry attempts
+    max_workers : int, default=4
+        Number of concurrent downloads
+    summary_path : str or Path, optional
+        If given, append each result to this JSON Lines file as it
+        completes, so progress survives a killed batch
 
     Returns
     -------
@@ -140,11 +163,29 @@ def fetch_multiple_videos(
     logger.info(f"Found {len(urls)} URLs in {url_file}")
 
     results = []
-    for i, url in enumerate(urls, 1):
-        logger.info(f"[{i}/{len(urls)}] Processing: {url}")
-        meta = fetch_video_ytdlp(url, output_dir, format_spec, max_retries)
-        if meta:
-            results.append(meta)
+    summary_fp = (
+        open(summary_path, "w", encoding="utf-8") if summary_path else None
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    fetch_video_ytdlp, url, output_dir, format_spec, max_retries
+                ): url
+                for url in urls
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                logger.info(f"[{i}/{len(urls)}] Finished: {url}")
+                meta = future.result()
+                if meta:
+                    results.append(meta)
+                    if summary_fp:
+                        summary_fp.write(json.dumps(meta, ensure_ascii=False) + "\n")
+                        summary_fp.flush()
+    finally:
+        if summary_fp:
+            summary_fp.close()
 
     return results
 
@@ -187,6 +228,19 @@ Examples:
         default=3,
         help="Maximum retry attempts",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Concurrent downloads for --url-file (default: 4)",
+    )
+    parser.add_argument(
+        "--summary-format",
+        default="jsonl",
+        choices=["jsonl", "json"],
+        help="Batch summary format: jsonl streams per download (default), "
+        "json writes one file at the end",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -218,16 +272,29 @@ Examples:
             logger.info(f"✓ Metadata saved: {meta_file}")
 
     else:  # url_file
+        # JSONL streams one record per completed download, so a killed batch
+        # keeps the progress made so far and memory stays bounded.
+        summary_file = (
+            Path(args.output) / "fetch_summary.jsonl"
+            if args.summary_format == "jsonl"
+            else None
+        )
         results = fetch_multiple_videos(
-            args.url_file, args.output, args.format, args.max_retries
+            args.url_file,
+            args.output,
+            args.format,
+            args.max_retries,
+            args.jobs,
+            summary_path=summary_file,
         )
         success = len(results) > 0
 
         if success:
-            # Save summary
-            summary_file = Path(args.output) / "fetch_summary.json"
-            with open(summary_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            if summary_file is None:
+                # Save summary in one shot (legacy JSON mode)
+                summary_file = Path(args.output) / "fetch_summary.json"
+                with open(summary_file, "w", encoding="utf-8") as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False)
             logger.info(f"✓ Summary saved: {summary_file}")
             logger.info(f"Successfully downloaded {len(results)} videos")
 
@@ -2,7 +2,9 @@
 # batch_extract.py
 # Batch extract audio from all videos in data/raw_videos (Unix/macOS)
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import logging
 
@@ -12,6 +14,48 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from thunder import utils
 import subprocess
 
+def _extract_one(
+    video_path: Path,
+    audio_path: Path,
+    sample_rate: int,
+    bit_depth: int,
+    channels: int,
+) -> tuple[str, bool, str]:
+    """
+    Run ffmpeg for one video (process-pool worker).
+
+    Returns (video name, success, stderr tail on failure).
+    """
+    bit_depth_map = {16: "s16", 24: "s24", 32: "s32"}
+    sample_fmt = bit_depth_map.get(bit_depth, "s24")
+
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",  # drop per-frame progress; stderr is errors only
+        "-i", str(video_path),
+        "-vn",  # No video
+        "-acodec", f"pcm_{sample_fmt}le",
+        "-ar", str(sample_rate),
+        "-ac", str(channels),
+        "-y",  # Overwrite
+        str(audio_path),
+    ]
+
+    try:
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        return video_path.name, False, "ffmpeg not found"
+
+    if proc.returncode != 0:
+        return video_path.name, False, proc.stderr[-4096:].decode("utf-8", "replace")
+    return video_path.name, True, ""
+
 def batch_extract_audio(
     video_dir: Path,
     audio_dir: Path,
@@ -22,6 +66,9 @@ def batch_extract_audio(
     """
     Extract audio from all videos in a directory.
 
+    ffmpeg invocations are independent, so they run in a process pool on
+    half the cores (ffmpeg threads internally; more workers oversubscribe).
+
     Parameters
     ----------
     video_dir : Path
@@ -40,11 +87,17 @@ def batch_extract_audio(
     # Create output directory
     audio_dir.mkdir(parents=True, exist_ok=True)
     
-    # Find all video files
-    video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.flv', '.wmv', '.webm']
-    video_files = []
-    for ext in video_extensions:
-        video_files.extend(video_dir.glob(f'*{ext}'))
+    # Find all video files in one directory pass; a glob per extension
+    # re-scans the directory seven times (case-insensitive as a bonus)
+    video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.flv', '.wmv', '.webm'}
+    if not video_dir.is_dir():
+        logger.warning(f"No video files found in {video_dir}")
+        return
+    video_files = [
+        Path(entry.path)
+        for entry in os.scandir(video_dir)
+        if entry.is_file() and Path(entry.name).suffix.lower() in video_extensions
+    ]
     
     if not video_files:
         logger.warning(f"No video files found in {video_dir}")
@@ -52,40 +105,26 @@ def batch_extract_audio(
     
     logger.info(f"Found {len(video_files)} video files")
     
-    # Extract audio from each video
-    for i, video_path in enumerate(video_files, 1):
-        audio_path = audio_dir / f"{video_path.stem}.wav"
-        
-        logger.info(f"[{i}/{len(video_files)}] Extracting: {video_path.name}")
-        
-        # Build ffmpeg command
-        bit_depth_map = {16: "s16", 24: "s24", 32: "s32"}
-        sample_fmt = bit_depth_map.get(bit_depth, "s24")
-        
-        cmd = [
-            "ffmpeg",
-            "-i", str(video_path),
-            "-vn",  # No video
-            "-acodec", f"pcm_{sample_fmt}le",
-            "-ar", str(sample_rate),
-            "-ac", str(channels),
-            "-y",  # Overwrite
-            str(audio_path),
-        ]
-        
-        try:
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
+    # Extract audio from each video in parallel
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _extract_one,
+                video_path,
+                audio_dir / f"{video_path.stem}.wav",
+                sample_rate,
+                bit_depth,
+                channels,
             )
-            logger.info(f"  ✓ Saved: {audio_path.name}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"  ✗ Failed: {e.stderr}")
-        except FileNotFoundError:
-            logger.error("  ✗ ffmpeg not found")
-            break
+            for video_path in video_files
+        ]
+        for i, future in enumerate(as_completed(futures), 1):
+            name, ok, error = future.result()
+            if ok:
+                logger.info(f"[{i}/{len(video_files)}] ✓ Extracted: {name}")
+            else:
+                logger.error(f"[{i}/{len(video_files)}] ✗ Failed: {name}: {error}")
 
 def main():
     """CLI entry point."""
@@ -9,6 +9,10 @@ Usage:
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import os
 import sys
 from pathlib import Path
 import json
@@ -18,6 +22,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from thunder import utils
 
+# Finished reports are cached keyed on the raw YAML bytes; see main
+_REPORT_CACHE_DIR = Path("~/.cache/thunder/validate").expanduser()
+
 
 def convert_ms_to_samples(ms: float, sample_rate: int) -> int:
     """Convert milliseconds to sample count."""
@@ -29,18 +36,41 @@ def convert_ms_to_seconds(ms: float) -> float:
     return ms / 1000.0
 
 
+def _check_ranges(checks, issues: list) -> None:
+    """
+    Append a message for each value that falls outside its bounds.
+
+    Each check is a ``(value, lo, hi, low_msg, high_msg)`` tuple; a bound of
+    None is not checked. Keeping the bounds declarative means each validator
+    is one table instead of a run of near-identical if statements.
+    """
+    for value, lo, hi, low_msg, high_msg in checks:
+        if lo is not None and value < lo:
+            issues.append(low_msg)
+        if hi is not None and value > hi:
+            issues.append(high_msg)
+
+
 def validate_audio_config(config: dict) -> dict:
     """Validate audio configuration."""
     audio = config.get("audio", {})
     issues = []
-    
+
     # Check sample rate
     sr = audio.get("sample_rate", 48000)
-    if sr < 8000:
-        issues.append(f"Sample rate too low: {sr} Hz (recommend >= 16000 Hz)")
-    if sr > 96000:
-        issues.append(f"Sample rate very high: {sr} Hz (may be unnecessary)")
-    
+    _check_ranges(
+        [
+            (
+                sr,
+                8000,
+                96000,
+                f"Sample rate too low: {sr} Hz (recommend >= 16000 Hz)",
+                f"Sample rate very high: {sr} Hz (may be unnecessary)",
+            ),
+        ],
+        issues,
+    )
+
     # Check frequency range
     highpass = audio.get("highpass_hz", 20)
     lowpass = audio.get("lowpass_hz", 6000)
@@ -63,18 +93,29 @@ def validate_detect_config(config: dict) -> dict:
     
     if hop_len > frame_len:
         issues.append(f"Hop length {hop_len}ms > frame length {frame_len}ms")
-    
+
     overlap = (frame_len - hop_len) / frame_len * 100
-    if overlap < 25:
-        issues.append(f"Low overlap: {overlap:.1f}% (recommend >= 50%)")
-    
-    # Check thresholds
     energy_db = detect.get("energy_thresh_db", -25)
-    if energy_db > -10:
-        issues.append(f"Energy threshold very high: {energy_db} dB (may miss events)")
-    if energy_db < -50:
-        issues.append(f"Energy threshold very low: {energy_db} dB (may detect noise)")
-    
+    _check_ranges(
+        [
+            (
+                overlap,
+                25,
+                None,
+                f"Low overlap: {overlap:.1f}% (recommend >= 50%)",
+                None,
+            ),
+            (
+                energy_db,
+                -50,
+                -10,
+                f"Energy threshold very low: {energy_db} dB (may detect noise)",
+                f"Energy threshold very high: {energy_db} dB (may miss events)",
+            ),
+        ],
+        issues,
+    )
+
     # Check merge gap vs min event
     merge_gap = detect.get("merge_gap_ms", 300)
     min_event = detect.get("min_event_ms", 150)
@@ -129,16 +170,19 @@ def validate_distance_config(config: dict) -> dict:
     distance = config.get("distance", {})
     issues = []
     
-    # Check speed of sound
+    # Check speed of sound and temperature
     c = distance.get("speed_of_sound", 343.5)
-    if c < 330 or c > 350:
-        issues.append(f"Speed of sound {c} m/s outside typical range (330-350 m/s)")
-    
-    # Check temperature
     temp = distance.get("reference_temp", 20)
-    if temp < -40 or temp > 50:
-        issues.append(f"Reference temperature {temp}°C outside typical range")
-    
+    c_msg = f"Speed of sound {c} m/s outside typical range (330-350 m/s)"
+    temp_msg = f"Reference temperature {temp}°C outside typical range"
+    _check_ranges(
+        [
+            (c, 330, 350, c_msg, c_msg),
+            (temp, -40, 50, temp_msg, temp_msg),
+        ],
+        issues,
+    )
+
     # Verify formula
     c_expected = 331.5 + 0.6 * temp
     if abs(c - c_expected) > 1.0:
@@ -167,11 +211,32 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
     # Load config
     print(f"Loading configuration: {args.config}\n")
+
+    # Validation is pure over the file contents, so the rendered report is
+    # cached keyed on the raw YAML bytes (plus output mode). An unchanged
+    # config replays the report without reparsing or revalidating.
+    config_path = Path(args.config)
+    cache_path = None
+    if config_path.exists():
+        key = hashlib.blake2b(
+            config_path.read_bytes() + (b"\x00json" if args.json else b"\x00text"),
+            digest_size=16,
+        ).hexdigest()
+        cache_path = _REPORT_CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                sys.stdout.write(cached["report"])
+                sys.exit(cached["status"])
+            except (OSError, json.JSONDecodeError, KeyError):
+                pass  # corrupt cache entry; validate from scratch below
+
     config = utils.load_config(args.config)
-    
+
     # Validate all sections
     results = [
         validate_audio_config(config),
@@ -179,10 +244,31 @@ def main():
         validate_features_config(config),
         validate_distance_config(config),
     ]
-    
+
     # Calculate summary
     total_issues = sum(len(r["issues"]) for r in results)
-    
+
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        _print_report(args, config, results, total_issues)
+    sys.stdout.write(report.getvalue())
+
+    status = 0 if total_issues == 0 else 1
+    if cache_path is not None:
+        try:
+            _REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = _REPORT_CACHE_DIR / f"{cache_path.stem}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"report": report.getvalue(), "status": status}, f)
+            tmp_path.replace(cache_path)  # atomic under concurrent runs
+        except OSError:
+            pass  # caching is best-effort
+
+    sys.exit(status)
+
+
+def _print_report(args, config: dict, results: list, total_issues: int) -> None:
+    """Render the validation report to stdout."""
     if args.json:
         print(json.dumps({"results": results, "total_issues": total_issues}, indent=2))
     else:
@@ -240,8 +326,6 @@ def main():
         print(f"  STFT window: {stft_win_ms}ms = {convert_ms_to_samples(stft_win_ms, sr)} samples")
         print(f"  STFT hop: {stft_hop_ms}ms = {convert_ms_to_samples(stft_hop_ms, sr)} samples")
         print(f"  STFT overlap: {(stft_win_ms - stft_hop_ms) / stft_win_ms * 100:.1f}%")
-    
-    sys.exit(0 if total_issues == 0 else 1)
 
 
 if __name__ == "__main__":
@@ -9,11 +9,16 @@ Usage:
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # headless PNG export; skip GUI backend machinery
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 import logging
 
 # Add parent directory to path
@@ -22,6 +27,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from thunder import io, utils
 
 
+# One Figure reused by every plot helper: Figure/Canvas construction and the
+# font-manager lookups it triggers are a fixed cost worth paying once, not
+# once per plot. Helpers clear it, resize it and draw; nothing closes it.
+_FIG = plt.figure()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_window(n_fft: int) -> np.ndarray:
+    """Hann window for an FFT size, computed once per size per process."""
+    from scipy.signal.windows import hann
+
+    return hann(n_fft).astype(np.float32)
+
+
 def plot_waveform_with_events(
     audio: np.ndarray,
     sr: int,
@@ -48,22 +67,44 @@ def plot_waveform_with_events(
     figsize : tuple, default=(12, 4)
         Figure size (width, height)
     """
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Time axis
-    time = np.arange(len(audio)) / sr
+    fig = _FIG
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    ax = fig.add_subplot(111)
+
+    # Decimate to ~2 points per horizontal pixel before plotting: the figure
+    # holds only figsize[0]*dpi pixels, so per-bin min/max is visually
+    # lossless while handing matplotlib orders of magnitude fewer vertices.
+    n_pix = int(figsize[0] * dpi)
+    if len(audio) > 4 * n_pix:
+        bin_size = len(audio) // n_pix
+        bins = audio[: n_pix * bin_size].reshape(n_pix, bin_size)
+        plot_y = np.empty(2 * n_pix, dtype=audio.dtype)
+        plot_y[0::2] = bins.min(axis=1)
+        plot_y[1::2] = bins.max(axis=1)
+        plot_t = np.repeat((np.arange(n_pix) + 0.5) * bin_size / sr, 2)
+    else:
+        plot_y = audio
+        plot_t = np.arange(len(audio)) / sr
 
     # Plot waveform
-    ax.plot(time, audio, color="steelblue", linewidth=0.5, label="Waveform")
-
-    # Highlight events
-    for i, event in enumerate(events):
-        ax.axvspan(
-            event["start"],
-            event["end"],
-            alpha=0.3,
-            color="red",
-            label="Thunder Event" if i == 0 else "",
+    ax.plot(plot_t, plot_y, color="steelblue", linewidth=0.5, label="Waveform")
+
+    # Highlight events with one PolyCollection: axvspan per event creates a
+    # full Polygon artist each, which adds up over hundreds of events.
+    if events:
+        starts = np.array([event["start"] for event in events])
+        ends = np.array([event["end"] for event in events])
+        y0, y1 = ax.get_ylim()
+        verts = np.empty((len(events), 4, 2))
+        verts[:, 0, 0] = starts
+        verts[:, 1, 0] = ends
+        verts[:, 2, 0] = ends
+        verts[:, 3, 0] = starts
+        verts[:, 0:2, 1] = y0
+        verts[:, 2:4, 1] = y1
+        ax.add_collection(
+            PolyCollection(verts, facecolor="red", alpha=0.3, label="Thunder Event")
         )
 
     ax.set_xlabel("Time (s)")
@@ -72,9 +113,11 @@ def plot_waveform_with_events(
     ax.legend(loc="upper right")
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi)
-    plt.close()
+    # Fixed margins avoid tight_layout's solver; compress_level=1 trades
+    # ~15% file size for a much faster PNG encode
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.9, bottom=0.14)
+    fig.savefig(output_path, dpi=dpi, pil_kwargs={"compress_level": 1})
+    fig.clear()
 
 
 def plot_spectrogram_with_events(
@@ -118,26 +161,55 @@ def plot_spectrogram_with_events(
     freq_range : tuple, default=(20, 6000)
         Frequency range (Hz)
     """
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Compute STFT
-    from scipy.signal import stft
-
-    f, t, Zxx = stft(audio, fs=sr, nperseg=n_fft, noverlap=n_fft - hop_length)
-
-    # Convert to dB
-    magnitude = np.abs(Zxx)
-    magnitude_db = 20 * np.log10(magnitude + 1e-10)
+    fig = _FIG
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    ax = fig.add_subplot(111)
+
+    # Compute STFT via a zero-copy framed view and one batched scipy rfft
+    # call instead of scipy.signal.stft. Unlike np.fft, scipy's pocketfft
+    # keeps float32 input in single precision (complex64 out), which is
+    # plenty for a plot (~1 dB precision) and halves FFT bandwidth; scaling
+    # by the window sum keeps dB levels comparable to scipy's stft output.
+    from scipy.fft import rfft
+
+    audio32 = np.ascontiguousarray(audio, dtype=np.float32)
+    if len(audio32) < n_fft:
+        audio32 = np.pad(audio32, (0, n_fft - len(audio32)))
+    window = _get_window(n_fft)
+    frames = np.lib.stride_tricks.sliding_window_view(audio32, n_fft)[::hop_length]
+    Zxx = rfft(frames * window, axis=1, overwrite_x=True).T / window.sum()
+    f = np.fft.rfftfreq(n_fft, 1 / sr)
+    t = np.arange(Zxx.shape[1]) * hop_length / sr
+
+    # Convert to dB in place on the one float32 buffer np.abs produces
+    # from the complex64 STFT; the naive 20*log10(abs(Z)+eps) chain
+    # allocates a fresh full-size array per step
+    magnitude_db = np.abs(Zxx)
+    np.maximum(magnitude_db, 1e-10, out=magnitude_db)
+    np.log10(magnitude_db, out=magnitude_db)
+    magnitude_db *= 20.0
 
     # Plot spectrogram
     im = ax.pcolormesh(
         t, f, magnitude_db, shading="auto", cmap="viridis", vmin=vmin, vmax=vmax
     )
 
-    # Mark events
-    for event in events:
-        ax.axvline(event["start"], color="red", linestyle="--", linewidth=1, alpha=0.7)
-        ax.axvline(event["end"], color="red", linestyle="--", linewidth=1, alpha=0.7)
+    # Mark events with a single LineCollection via vlines rather than two
+    # axvline artists per event
+    if events:
+        boundaries = np.array(
+            [[event["start"], event["end"]] for event in events]
+        ).ravel()
+        ax.vlines(
+            boundaries,
+            freq_range[0],
+            freq_range[1],
+            colors="red",
+            linestyles="--",
+            linewidth=1,
+            alpha=0.7,
+        )
 
     ax.set_xlabel("Time (s)")
     ax.set_ylabel("Frequency (Hz)")
@@ -146,10 +218,10 @@ def plot_spectrogram_with_events(
     ax.set_ylim(freq_range)
     ax.grid(True, alpha=0.3, which="both")
 
-    cbar = plt.colorbar(im, ax=ax, label="Magnitude (dB)")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi)
-    plt.close()
+    cbar = fig.colorbar(im, ax=ax, label="Magnitude (dB)")
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.94, bottom=0.1)
+    fig.savefig(output_path, dpi=dpi, pil_kwargs={"compress_level": 1})
+    fig.clear()
 
 
 def plot_feature_histograms(
@@ -181,15 +253,31 @@ def plot_feature_histograms(
     n_cols = 3
     n_rows = (n_features + n_cols - 1) // n_cols
 
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=figsize)
-    axes = axes.flatten()
+    fig = _FIG
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    axes = fig.subplots(n_rows, n_cols).flatten()
+
+    # One conversion to a numpy matrix up front; per-column Series.dropna
+    # plus ax.hist's input munging dominate on wide feature frames
+    mat = features_df[plot_cols].to_numpy(dtype=np.float64)
 
     for i, col in enumerate(plot_cols):
         ax = axes[i]
-        data = features_df[col].dropna()
+        data = mat[:, i]
+        data = data[~np.isnan(data)]
 
         if len(data) > 0:
-            ax.hist(data, bins=20, color="steelblue", edgecolor="black", alpha=0.7)
+            counts, edges = np.histogram(data, bins=20)
+            ax.bar(
+                edges[:-1],
+                counts,
+                width=np.diff(edges),
+                align="edge",
+                color="steelblue",
+                edgecolor="black",
+                alpha=0.7,
+            )
             ax.set_title(col, fontsize=10)
             ax.set_xlabel("Value")
             ax.set_ylabel("Count")
@@ -199,9 +287,11 @@ def plot_feature_histograms(
     for i in range(n_features, len(axes)):
         axes[i].axis("off")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi)
-    plt.close()
+    fig.subplots_adjust(
+        left=0.08, right=0.98, top=0.94, bottom=0.08, wspace=0.3, hspace=0.6
+    )
+    fig.savefig(output_path, dpi=dpi, pil_kwargs={"compress_level": 1})
+    fig.clear()
 
 
 def main():
@@ -255,10 +345,22 @@ Examples:
     logger.info(f"Loading audio: {args.audio}")
     audio, sr = io.load_audio(args.audio)
 
-    # Load events
+    # Load events: the plots only need start/end, so skip parsing the other
+    # columns entirely, and float32 is ample precision for pixel positions
     logger.info(f"Loading events: {args.events}")
-    events_df = pd.read_csv(args.events)
-    events = events_df.to_dict("records")
+    events_df = utils.read_table(
+        args.events,
+        dtype={"start": "float32", "end": "float32"},
+        usecols=["start", "end"],
+    )
+    # The plot helpers only look at start/end, so zip those two numpy
+    # columns instead of materializing full per-row dicts
+    events = [
+        {"start": start, "end": end}
+        for start, end in zip(
+            events_df["start"].to_numpy(), events_df["end"].to_numpy()
+        )
+    ]
     logger.info(f"Found {len(events)} events")
 
     # Plot waveform
@@ -299,7 +401,7 @@ Examples:
     # Plot feature histograms
     if args.features:
         logger.info(f"Loading features: {args.features}")
-        features_df = pd.read_csv(args.features)
+        features_df = utils.read_table(args.features)
 
         logger.info("Plotting feature histograms...")
         hist_path = output_dir / "feature_histograms.png"
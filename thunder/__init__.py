@@ -11,15 +11,16 @@ Modules:
     features: Acoustic feature extraction
     distance: Distance estimation from flash-to-thunder delay
     metadata: Metadata handling and logging
+    memoize: On-disk memoization for deterministic transforms
     utils: Utility functions
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "s4t02h1"
 __license__ = "MIT"
 
-from thunder import io, preprocess, detection, features, distance, metadata, utils
-
 __all__ = [
     "io",
     "preprocess",
@@ -27,5 +28,23 @@ __all__ = [
     "features",
     "distance",
     "metadata",
+    "memoize",
     "utils",
 ]
+
+# Submodules load lazily (PEP 562): scipy/librosa pulled in by the signal
+# modules cost seconds of import time, and CLI scripts that only need
+# utils or metadata shouldn't pay it.
+_LAZY_MODULES = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(f"thunder.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_MODULES)
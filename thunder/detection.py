@@ -11,6 +11,8 @@ import librosa
 from typing import List, Tuple
 import logging
 
+from .features import compute_magnitude_spectrum
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,7 +90,8 @@ def compute_spectral_flux(
     --------
     >>> times, flux = compute_spectral_flux(audio, 48000)
     """
-    stft = np.abs(librosa.stft(audio, n_fft=n_fft, hop_length=hop_length))
+    # Batched multi-threaded rFFT; see features.compute_magnitude_spectrum
+    stft = compute_magnitude_spectrum(audio, n_fft=n_fft, hop_length=hop_length)
 
     # Compute differences between consecutive frames
     flux = np.sqrt(np.sum(np.diff(stft, axis=1) ** 2, axis=0))
@@ -98,12 +101,28 @@ def compute_spectral_flux(
     return times, flux
 
 
+def _precompute_spectrogram(
+    audio: np.ndarray, sr: int, n_fft: int = 2048, hop_length: int = 512
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shared magnitude STFT and frame times for both detectors.
+
+    One transform feeds energy (column sums of power) and spectral flux
+    (column differences), instead of each detector re-framing and
+    re-transforming the recording.
+    """
+    spectrum = compute_magnitude_spectrum(audio, n_fft=n_fft, hop_length=hop_length)
+    times = np.arange(spectrum.shape[1]) * hop_length / sr
+    return spectrum, times
+
+
 def detect_events_energy(
     audio: np.ndarray,
     sr: int,
     energy_threshold: float = 0.01,
     window_size: float = 0.05,
     hop_length: float = 0.01,
+    precomputed: Tuple[np.ndarray, np.ndarray] | None = None,
 ) -> List[Tuple[float, float]]:
     """
     Detect events using energy threshold.
@@ -120,6 +139,10 @@ def detect_events_energy(
         Window size in seconds
     hop_length : float, default=0.01
         Hop length in seconds
+    precomputed : tuple, optional
+        (spectrum, times) from _precompute_spectrogram; when given, the
+        energy envelope is derived from it (Parseval) instead of running a
+        separate RMS framing pass, and window_size/hop_length are ignored
 
     Returns
     -------
@@ -130,30 +153,48 @@ def detect_events_energy(
     --------
     >>> events = detect_events_energy(audio, 48000, energy_threshold=0.01)
     """
-    times, energy = compute_energy_envelope(audio, sr, window_size, hop_length)
+    events = _detect_events_energy_arr(
+        audio, sr, energy_threshold, window_size, hop_length, precomputed
+    )
+    return list(map(tuple, events.tolist()))
+
+
+def _detect_events_energy_arr(
+    audio: np.ndarray,
+    sr: int,
+    energy_threshold: float,
+    window_size: float,
+    hop_length: float,
+    precomputed: Tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Energy detection returning an (N, 2) start/end array."""
+    if precomputed is not None:
+        spectrum, times = precomputed
+        energy = np.sqrt(np.sum(spectrum**2, axis=0))
+    else:
+        times, energy = compute_energy_envelope(audio, sr, window_size, hop_length)
+
+    # Audio shorter than one analysis window yields no frames; no events
+    if len(energy) == 0:
+        logger.info("Detected 0 events (energy threshold)")
+        return np.empty((0, 2), dtype=np.float64)
 
     # Threshold
     threshold = energy_threshold * np.max(energy)
     above_threshold = energy > threshold
 
-    # Find contiguous regions
-    events = []
-    in_event = False
-    start_time = None
-
-    for i, (time, above) in enumerate(zip(times, above_threshold)):
-        if above and not in_event:
-            # Event start
-            start_time = time
-            in_event = True
-        elif not above and in_event:
-            # Event end
-            events.append((start_time, time))
-            in_event = False
-
-    # Close final event if needed
-    if in_event:
-        events.append((start_time, times[-1]))
+    # Find contiguous regions via edge detection on the boolean mask: padding
+    # with False and diffing yields +1 at each rise and -1 at each fall, all
+    # in C, instead of a Python loop over every frame
+    padded = np.zeros(len(above_threshold) + 2, dtype=np.int8)
+    padded[1:-1] = above_threshold
+    edges = np.diff(padded)
+    starts = np.where(edges == 1)[0]
+    ends = np.where(edges == -1)[0]
+    # A region still open at the last frame ends at the final timestamp
+    ends = np.minimum(ends, len(times) - 1)
+
+    events = np.column_stack((times[starts], times[ends]))
 
     logger.info(f"Detected {len(events)} events (energy threshold)")
     return events
@@ -165,6 +206,7 @@ def detect_events_spectral(
     spectral_threshold: float = 0.1,
     n_fft: int = 2048,
     hop_length: int = 512,
+    precomputed: Tuple[np.ndarray, np.ndarray] | None = None,
 ) -> List[Tuple[float, float]]:
     """
     Detect events using spectral flux.
@@ -181,6 +223,9 @@ def detect_events_spectral(
         FFT window size
     hop_length : int, default=512
         Hop length
+    precomputed : tuple, optional
+        (spectrum, times) from _precompute_spectrogram; when given, flux is
+        derived from it instead of running another STFT
 
     Returns
     -------
@@ -191,24 +236,45 @@ def detect_events_spectral(
     --------
     >>> events = detect_events_spectral(audio, 48000)
     """
-    times, flux = compute_spectral_flux(audio, sr, n_fft, hop_length)
+    events = _detect_events_spectral_arr(
+        audio, sr, spectral_threshold, n_fft, hop_length, precomputed
+    )
+    return list(map(tuple, events.tolist()))
+
+
+def _detect_events_spectral_arr(
+    audio: np.ndarray,
+    sr: int,
+    spectral_threshold: float,
+    n_fft: int,
+    hop_length: int,
+    precomputed: Tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Spectral-flux detection returning an (N, 2) start/end array."""
+    if precomputed is not None:
+        spectrum, frame_times = precomputed
+        flux = np.sqrt(np.sum(np.diff(spectrum, axis=1) ** 2, axis=0))
+        times = frame_times[: len(flux)]
+    else:
+        times, flux = compute_spectral_flux(audio, sr, n_fft, hop_length)
+
+    # Audio shorter than one analysis window yields no flux frames
+    if len(flux) == 0:
+        logger.info("Detected 0 events (spectral flux)")
+        return np.empty((0, 2), dtype=np.float64)
 
     # Threshold
     threshold = spectral_threshold * np.max(flux)
-    above_threshold = flux > threshold
 
     # Find peaks
     peaks, _ = signal.find_peaks(flux, height=threshold)
 
-    # Convert to time
-    events = []
-    for peak in peaks:
-        if peak < len(times):
-            peak_time = times[peak]
-            # Simple event: ±0.5s around peak
-            start = max(0, peak_time - 0.5)
-            end = min(times[-1], peak_time + 0.5)
-            events.append((start, end))
+    # Convert to time: ±0.5s around each peak, clipped to the recording,
+    # computed on the whole peak array instead of per-peak Python arithmetic
+    peak_times = times[peaks[peaks < len(times)]]
+    starts = np.maximum(0.0, peak_times - 0.5)
+    ends = np.minimum(times[-1], peak_times + 0.5)
+    events = np.column_stack((starts, ends))
 
     logger.info(f"Detected {len(events)} events (spectral flux)")
     return events
@@ -241,27 +307,44 @@ def merge_events(
     if not events:
         return []
 
-    # Sort by start time
-    events = sorted(events, key=lambda x: x[0])
+    events_arr = np.asarray(events, dtype=np.float64)
+    merged = _merge_events_arr(events_arr, merge_gap, min_duration)
+    return list(map(tuple, merged.tolist()))
+
 
-    merged = []
-    current_start, current_end = events[0]
+def _merge_events_arr(
+    events_arr: np.ndarray, merge_gap: float, min_duration: float
+) -> np.ndarray:
+    """
+    Merge an (N, 2) start/end array, returning the merged (M, 2) array.
+
+    Structure-of-arrays sweep: sort by start, take the running max of ends,
+    and split groups where the next start clears the running max by more
+    than merge_gap. The running max never leaks across a split (any interval
+    after a split starts above it), so the global cumulative max equals the
+    per-group one.
+    """
+    if len(events_arr) == 0:
+        return events_arr.reshape(0, 2)
 
-    for start, end in events[1:]:
-        if start - current_end <= merge_gap:
-            # Merge with current event
-            current_end = max(current_end, end)
-        else:
-            # Save current and start new
-            if current_end - current_start >= min_duration:
-                merged.append((current_start, current_end))
-            current_start, current_end = start, end
+    order = np.argsort(events_arr[:, 0], kind="stable")
+    starts = events_arr[order, 0]
+    ends = events_arr[order, 1]
 
-    # Add final event
-    if current_end - current_start >= min_duration:
-        merged.append((current_start, current_end))
+    cummax_ends = np.maximum.accumulate(ends)
+    new_group = np.empty(len(starts), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] - cummax_ends[:-1] > merge_gap
 
-    logger.info(f"Merged {len(events)} → {len(merged)} events")
+    group_first = np.where(new_group)[0]
+    group_last = np.append(group_first[1:] - 1, len(starts) - 1)
+    merged_starts = starts[group_first]
+    merged_ends = cummax_ends[group_last]
+
+    keep = merged_ends - merged_starts >= min_duration
+    merged = np.column_stack((merged_starts[keep], merged_ends[keep]))
+
+    logger.info(f"Merged {len(events_arr)} → {len(merged)} events")
     return merged
 
 
@@ -298,27 +381,36 @@ def detect_thunder_events(
     >>> config = {"energy_threshold": 0.01, "merge_gap": 0.5}
     >>> events = detect_thunder_events(audio, 48000, config)
     """
+    # One spectrogram feeds both detectors; events stay as contiguous
+    # (N, 2) arrays through the union and merge, converting to dicts only
+    # at the end
+    precomputed = _precompute_spectrogram(audio, sr)
+
     # Energy-based detection
-    events_energy = detect_events_energy(
+    events_energy = _detect_events_energy_arr(
         audio,
         sr,
         energy_threshold=config.get("energy_threshold", 0.01),
         window_size=config.get("window_size", 0.05),
         hop_length=config.get("hop_length", 0.01),
+        precomputed=precomputed,
     )
 
     # Spectral-based detection
-    events_spectral = detect_events_spectral(
+    events_spectral = _detect_events_spectral_arr(
         audio,
         sr,
         spectral_threshold=config.get("spectral_threshold", 0.1),
+        n_fft=2048,
+        hop_length=512,
+        precomputed=precomputed,
     )
 
     # Combine (union)
-    all_events = events_energy + events_spectral
+    all_events = np.vstack((events_energy, events_spectral))
 
     # Merge close events
-    merged_events = merge_events(
+    merged_events = _merge_events_arr(
         all_events,
         merge_gap=config.get("merge_gap", 0.5),
         min_duration=config.get("min_duration", 0.1),
@@ -326,7 +418,7 @@ def detect_thunder_events(
 
     # Extract peak info for each event
     detailed_events = []
-    for start, end in merged_events:
+    for start, end in merged_events.tolist():
         start_sample = int(start * sr)
         end_sample = int(end * sr)
         segment = audio[start_sample:end_sample]
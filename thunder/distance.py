@@ -165,28 +165,32 @@ def estimate_distances_for_events(
         logger.warning("No flash times provided. Skipping distance estimation.")
         return events
 
-    events_with_distance = []
-
-    for event in events:
-        thunder_time = event["start"]
-
-        # Find closest preceding flash
-        preceding_flashes = [f for f in flash_times if f < thunder_time]
-
-        if preceding_flashes:
-            flash_time = max(preceding_flashes)
-            time_delay = thunder_time - flash_time
-
-            distance = estimate_distance(time_delay, temperature_celsius)
+    # Match every event to its closest preceding flash with one binary
+    # search per event instead of scanning the full flash list each time:
+    # searchsorted(side="left") - 1 lands on the last flash strictly before
+    # the thunder onset, or -1 when none precedes it.
+    flashes = np.sort(np.asarray(flash_times, dtype=np.float64))
+    thunder_times = np.fromiter(
+        (event["start"] for event in events), np.float64, count=len(events)
+    )
+    idx = np.searchsorted(flashes, thunder_times, side="left") - 1
+    matched = flashes[np.clip(idx, 0, None)]
+    delays = thunder_times - matched
+    distances = speed_of_sound(temperature_celsius) * delays
 
+    events_with_distance = []
+    for event, has_flash, flash_time, time_delay, distance in zip(
+        events, idx >= 0, matched, delays, distances
+    ):
+        if has_flash:
             event_copy = event.copy()
-            event_copy["flash_time"] = flash_time
-            event_copy["time_delay"] = time_delay
-            event_copy["distance_m"] = distance
-            event_copy["distance_km"] = distance / 1000
+            event_copy["flash_time"] = float(flash_time)
+            event_copy["time_delay"] = float(time_delay)
+            event_copy["distance_m"] = float(distance)
+            event_copy["distance_km"] = float(distance) / 1000
             events_with_distance.append(event_copy)
         else:
-            logger.warning(f"No preceding flash for event @ {thunder_time:.2f}s")
+            logger.warning(f"No preceding flash for event @ {event['start']:.2f}s")
             events_with_distance.append(event)
 
     logger.info(f"Estimated distances for {len(events_with_distance)} events")
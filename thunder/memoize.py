@@ -0,0 +1,85 @@
+"""
+thunder.memoize
+===============
+
+On-disk memoization for deterministic array transforms.
+"""
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = Path("~/.cache/thunder/memoize").expanduser()
+
+
+def _array_digest(audio: np.ndarray) -> str:
+    """Digest of an array's raw bytes plus its dtype and shape."""
+    audio = np.ascontiguousarray(audio)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{audio.dtype}:{audio.shape}".encode())
+    h.update(audio)
+    return h.hexdigest()
+
+
+def disk_memoize(cache_dir: Optional[str | Path] = None) -> Callable:
+    """
+    Memoize an ``audio -> ndarray`` transform on disk.
+
+    The wrapped function gains a ``memoize`` keyword (default False). When
+    enabled, the result is keyed on a digest of the input array plus the
+    repr of the remaining arguments and stored as ``.npy``; hits are
+    reloaded with ``mmap_mode="r"``, so a cached result costs no RAM until
+    touched. Only safe for deterministic functions.
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        Cache root (default ``~/.cache/thunder/memoize``)
+
+    Examples
+    --------
+    >>> denoised = reduce_noise_spectral_subtraction(audio, 48000, memoize=True)
+    """
+    cache_root = Path(cache_dir).expanduser() if cache_dir else _DEFAULT_CACHE_DIR
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(audio, *args, memoize: bool = False, **kwargs):
+            if not memoize:
+                return func(audio, *args, **kwargs)
+
+            h = hashlib.blake2b(digest_size=16)
+            h.update(_array_digest(audio).encode())
+            h.update(repr((args, sorted(kwargs.items()))).encode())
+            cache_path = cache_root / func.__name__ / f"{h.hexdigest()}.npy"
+
+            if cache_path.exists():
+                try:
+                    result = np.load(cache_path, mmap_mode="r")
+                    logger.info("Memoized result reused: %s", cache_path)
+                    return result
+                except (OSError, ValueError):
+                    pass  # corrupt or unreadable entry; recompute below
+
+            result = func(audio, *args, **kwargs)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(
+                    f"{cache_path.stem}.{os.getpid()}.tmp.npy"
+                )
+                np.save(tmp_path, result)
+                tmp_path.replace(cache_path)  # atomic under concurrent runs
+            except OSError:
+                pass  # caching is best-effort; the result is still returned
+            return result
+
+        return wrapper
+
+    return decorator
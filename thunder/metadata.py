@@ -5,20 +5,31 @@ thunder.metadata
 Metadata handling and logging for research reproducibility.
 """
 
+import functools
 import json
 import hashlib
+import os
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json remains the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_video_id(url: str) -> str:
     """
     Generate unique video ID from URL.
 
+    Memoized: batch pipelines call this repeatedly with the same URLs.
+
     Parameters
     ----------
     url : str
@@ -33,7 +44,44 @@ def generate_video_id(url: str) -> str:
     --------
     >>> video_id = generate_video_id("https://www.youtube.com/watch?v=example")
     """
-    return hashlib.md5(url.encode()).hexdigest()[:8]
+    # Fingerprint, not cryptography: blake2b with a 4-byte digest gives the
+    # same 8-hex-char ID shape as the old truncated MD5 at a fraction of the
+    # per-call cost, without leaving the standard library
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+
+
+def hash_file(filepath: str | Path, algorithm: str = "sha256") -> str:
+    """
+    Hash a file's raw bytes.
+
+    Uses ``hashlib.file_digest`` (Python 3.11+), which reads through a
+    reusable buffer and picks up hardware-accelerated SHA instructions where
+    available — far faster than decoding the audio just to fingerprint it.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        File to hash
+    algorithm : str, default="sha256"
+        Hash algorithm name
+
+    Returns
+    -------
+    digest : str
+        Hex digest
+
+    Examples
+    --------
+    >>> digest = hash_file("audio.wav")
+    """
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, algorithm).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _config_hash(config_json: str) -> str:
+    """Digest of canonical config JSON, hashed once per unique config."""
+    return hashlib.blake2b(config_json.encode(), digest_size=16).hexdigest()
 
 
 def create_metadata(
@@ -68,7 +116,9 @@ def create_metadata(
         "fetch_date": datetime.now().isoformat(),
         "analysis_timestamp": datetime.now().isoformat(),
         "config": config,
-        "config_hash": hashlib.md5(json.dumps(config, sort_keys=True).encode()).hexdigest(),
+        "config_hash": _config_hash(
+            json.dumps(config, sort_keys=True, separators=(",", ":"))
+        ),
         "version": "0.1.0",
         "citation_required": True,
         "license": "MIT",
@@ -98,8 +148,13 @@ def save_metadata(metadata: Dict[str, Any], filepath: str | Path) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        filepath.write_bytes(
+            orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
 
     logger.info(f"Metadata saved: {filepath}")
 
@@ -126,13 +181,97 @@ def load_metadata(filepath: str | Path) -> Dict[str, Any]:
     if not filepath.exists():
         raise FileNotFoundError(f"Metadata file not found: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        metadata = json.load(f)
+    if orjson is not None:
+        metadata = orjson.loads(filepath.read_bytes())
+    else:
+        with open(filepath, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
 
     logger.info(f"Metadata loaded: {filepath}")
     return metadata
 
 
+# Fixed-schema columns for the Parquet metadata table; everything else in a
+# metadata dict stays in the per-clip JSON
+_TABLE_COLUMNS = (
+    "source_url",
+    "video_id",
+    "fetch_date",
+    "analysis_timestamp",
+    "config_hash",
+    "version",
+)
+
+
+def append_metadata(table_path: str | Path, metadata: Dict[str, Any]) -> None:
+    """
+    Append one run's metadata to a columnar Parquet table.
+
+    Per-clip JSON files are fine for debugging a single run, but querying
+    thousands of them (filter by config hash, group by date) means a full
+    directory scan and a JSON parse per file. This writes the fixed-schema
+    columns as one-row Parquet fragments in a dataset directory, so appends
+    are O(1) and analytic queries read only the columns they touch.
+
+    Parameters
+    ----------
+    table_path : str or Path
+        Dataset directory (created if missing)
+    metadata : dict
+        Metadata from create_metadata; keys outside the table schema are
+        ignored here and belong in the per-clip JSON
+
+    Examples
+    --------
+    >>> append_metadata("outputs/metadata", meta)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table_path = Path(table_path)
+    table_path.mkdir(parents=True, exist_ok=True)
+
+    table = pa.table({col: [metadata.get(col)] for col in _TABLE_COLUMNS})
+    fragment = table_path / f"{time.time_ns()}-{os.getpid()}.parquet"
+    pq.write_table(table, fragment)
+
+    logger.info(f"Metadata appended: {fragment}")
+
+
+def query_metadata(table_path: str | Path, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    Query the Parquet metadata table with equality filters.
+
+    Predicates are pushed down into the Parquet reader, so fragments and
+    columns that cannot match are never deserialized.
+
+    Parameters
+    ----------
+    table_path : str or Path
+        Dataset directory written by append_metadata
+    **filters
+        Column-name=value equality filters (e.g. ``config_hash="ab12..."``)
+
+    Returns
+    -------
+    rows : list of dict
+        Matching metadata rows
+
+    Examples
+    --------
+    >>> runs = query_metadata("outputs/metadata", config_hash=meta["config_hash"])
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(str(table_path), format="parquet")
+    expression = None
+    for column, value in filters.items():
+        clause = ds.field(column) == value
+        expression = clause if expression is None else expression & clause
+
+    return dataset.to_table(filter=expression).to_pylist()
+
+
 def verify_reproducibility(
     metadata1: Dict[str, Any], metadata2: Dict[str, Any]
 ) -> bool: